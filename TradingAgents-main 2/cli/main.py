@@ -22,7 +22,7 @@ from tradingagents.utils.message_utils import has_tool_calls
 from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
-from tradingagents import load_config, validate_api_keys
+from tradingagents import load_config, api_key_manager
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
@@ -712,7 +712,8 @@ def extract_content_string(content):
 def run_analysis():
     # APIキーの検証と.envファイルの読み込み
     console.print("[bold blue]🔑 APIキーを確認中...[/bold blue]")
-    if not validate_api_keys():
+    api_key_manager.cli_report()
+    if not api_key_manager.has_required_keys():
         console.print("[bold red]❗ APIキーが不足しています。アプリケーションを終了します。[/bold red]")
         console.print("[bold yellow]プロジェクトルートに .env ファイルを作成し、.env.example を参考に設定してください。[/bold yellow]")
         return
@@ -1,30 +1,35 @@
 from tradingagents.graph.trading_graph import TradingAgentsGraph
-from tradingagents import load_config, validate_api_keys
+from typing import Any, Dict, Union
+from tradingagents import load_config, api_key_manager, PartialConfig, TradingAgentsConfig
 from tradingagents.default_config import DEFAULT_CONFIG
 
 # APIキーの検証と.envファイルの読み込み
 print("🔑 APIキーを確認中...")
-if not validate_api_keys():
+api_key_manager.cli_report()
+if not api_key_manager.has_required_keys():
     print("❗ APIキーが不足しています。アプリケーションを終了します。")
     exit(1)
 
 print("✅ APIキーの確認が完了しました。")
 
+# カスタム設定（load_configのoverrideとして適用）
+overrides: PartialConfig = {
+    # "llm_provider": "google",  # 他のLLMプロバイダーを使用する場合
+    # "backend_url": "https://generativelanguage.googleapis.com/v1",  # Google APIの場合
+    # "deep_think_llm": "gemini-2.0-flash",  # Googleモデルを使用する場合
+    # "quick_think_llm": "gemini-2.0-flash",  # Googleモデルを使用する場合
+    "max_debate_rounds": 1,  # ディベートラウンド数
+    "online_tools": True,  # オンラインツールの使用
+}
+
 # 設定をロード（APIキー検証は上で完了済みなのでスキップ）
+config: Union[Dict[str, Any], TradingAgentsConfig]
 try:
-    config = load_config(validate_keys=False)  # 既に検証済みなのでFalse
+    config = load_config(override=overrides, validate_keys=False)  # 既に検証済みなのでFalse
 except Exception as e:
     print(f"❗ 設定の読み込みに失敗しました: {e}")
     print("フォールバックでデフォルト設定を使用します...")
-    config = DEFAULT_CONFIG.copy()
-
-# カスタム設定の適用
-# config["llm_provider"] = "google"  # 他のLLMプロバイダーを使用する場合
-# config["backend_url"] = "https://generativelanguage.googleapis.com/v1"  # Google APIの場合
-# config["deep_think_llm"] = "gemini-2.0-flash"  # Googleモデルを使用する場合
-# config["quick_think_llm"] = "gemini-2.0-flash"  # Googleモデルを使用する場合
-config["max_debate_rounds"] = 1  # ディベートラウンド数
-config["online_tools"] = True  # オンラインツールの使用
+    config = dict(DEFAULT_CONFIG, **overrides)
 
 # グラフの初期化
 print("🚀 TradingAgentsグラフを初期化中...")
@@ -37,12 +42,10 @@ date = "2024-05-10"
 print(f"📈 {ticker} ({date}) の分析を開始...")
 _, decision = ta.propagate(ticker, date)
 
-print(f"
-📋 分析結果:")
+print("\n📋 分析結果:")
 print(decision)
 
 # メモリ機能（オプション）
 # ポジションのリターンをパラメーターとして指定
 # ta.reflect_and_remember(1000)
-print("
-✅ 分析が完了しました。")
+print("\n✅ 分析が完了しました。")
@@ -6,21 +6,69 @@ TradingAgents - マルチエージェントLLM駆動金融取引フレームワ
 協力して取引決定を行うフレームワークです。
 """
 
-from .default_config import DEFAULT_CONFIG, get_default_config
-from .config_loader import load_config, validate_config, get_config_from_env
-from .config_types import TradingAgentsConfig, PartialConfig, LLMProviderType
-from .api_keys import (
-    APIKeyManager,
-    api_key_manager,
-    get_api_key,
-    validate_api_keys,
-    get_provider_api_key
-)
-from .setup_utils import (
-    check_environment,
-    setup_environment,
-    quick_setup
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .default_config import DEFAULT_CONFIG, get_default_config
+    from .config_loader import (
+        load_config,
+        validate_config,
+        get_config_from_env,
+        invalidate_config_cache
+    )
+    from .config_types import TradingAgentsConfig, PartialConfig, LLMProviderType
+    from .api_keys import (
+        APIKeyManager,
+        api_key_manager,
+        get_api_key,
+        has_required_keys,
+        validate_api_keys,
+        get_provider_api_key
+    )
+    from .setup_utils import (
+        check_environment,
+        setup_environment,
+        quick_setup
+    )
+
+# 公開名 -> 定義元サブモジュール（初回アクセス時にインポートする）
+_LAZY_ATTRS = {
+    "DEFAULT_CONFIG": "default_config",
+    "get_default_config": "default_config",
+    "load_config": "config_loader",
+    "validate_config": "config_loader",
+    "get_config_from_env": "config_loader",
+    "invalidate_config_cache": "config_loader",
+    "TradingAgentsConfig": "config_types",
+    "PartialConfig": "config_types",
+    "LLMProviderType": "config_types",
+    "APIKeyManager": "api_keys",
+    "api_key_manager": "api_keys",
+    "get_api_key": "api_keys",
+    "has_required_keys": "api_keys",
+    "validate_api_keys": "api_keys",
+    "get_provider_api_key": "api_keys",
+    "check_environment": "setup_utils",
+    "setup_environment": "setup_utils",
+    "quick_setup": "setup_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # サブモジュール（rich等の重い依存を含む）はインポート時ではなく初回アクセス時に読み込む
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    if name != "api_key_manager":
+        globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
 
 __version__ = "1.0.0"
 __author__ = "TradingAgents Team"
@@ -33,6 +81,7 @@ __all__ = [
     "load_config",
     "validate_config",
     "get_config_from_env",
+    "invalidate_config_cache",
     "TradingAgentsConfig",
     "PartialConfig",
     "LLMProviderType",
@@ -41,6 +90,7 @@ __all__ = [
     "APIKeyManager",
     "api_key_manager",
     "get_api_key",
+    "has_required_keys",
     "validate_api_keys",
     "get_provider_api_key",
     
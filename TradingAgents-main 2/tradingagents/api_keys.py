@@ -4,17 +4,24 @@ TradingAgentsプロジェクトのAPIキー管理モジュール
 このモジュールはAPIキーの安全な管理、検証、および取得機能を提供します。
 """
 
+import logging
 import os
-from typing import Dict, Optional, Tuple
+from functools import cache
+from typing import Dict, Iterator, Optional, Tuple
 from .config_types import LLMProviderType
 
+logger = logging.getLogger(__name__)
+
 
 class APIKeyManager:
     """APIキーの管理クラス
     
     このクラスはAPIキーの検証、取得、プロバイダー固有の処理を提供します。
+    インスタンス状態を持たない（キーは都度os.environから読む）ため__slots__は空です。
     """
     
+    __slots__ = ()
+    
     # 必須APIキー
     REQUIRED_KEYS = {
         "OPENAI_API_KEY": "OpenAI API",
@@ -36,19 +43,19 @@ class APIKeyManager:
         "openrouter": ["OPENAI_API_KEY"]  # OpenRouter互換
     }
     
-    def __init__(self):
-        """APIキーマネージャーを初期化"""
-        self._api_keys_cache: Dict[str, str] = {}
-        self._load_api_keys()
+    # 集合演算による検証用の事前計算済みキー集合
+    _REQUIRED_SET = frozenset(REQUIRED_KEYS)
+    _ALL_KEYS = (*REQUIRED_KEYS, *OPTIONAL_KEYS)
+    _PROVIDER_SETS = {k: frozenset(v) for k, v in PROVIDER_API_KEYS.items()}
     
-    def _load_api_keys(self) -> None:
-        """環境変数からAPIキーを読み込み"""
-        all_keys = {**self.REQUIRED_KEYS, **self.OPTIONAL_KEYS}
+    def _present_keys(self) -> frozenset[str]:
+        """現在の環境変数で値が設定されている既知のAPIキー名を取得
         
-        for key_name in all_keys:
-            value = os.getenv(key_name)
-            if value:
-                self._api_keys_cache[key_name] = value
+        スナップショットを保持せず毎回os.environを参照するため、
+        インポート後に設定されたキーや.envから読み込まれたキーも反映されます。
+        """
+        env = os.environ
+        return frozenset(k for k in self._ALL_KEYS if env.get(k))
     
     def get_api_key(self, key_name: str) -> Optional[str]:
         """APIキーを安全に取得
@@ -59,7 +66,7 @@ class APIKeyManager:
         Returns:
             Optional[str]: APIキーの値、存在しない場合はNone
         """
-        return self._api_keys_cache.get(key_name)
+        return os.environ.get(key_name) or None
     
     def validate_all_keys(self) -> Tuple[Dict[str, bool], Dict[str, str]]:
         """全APIキーの存在を検証
@@ -69,24 +76,19 @@ class APIKeyManager:
                 - キーの存在状況
                 - エラーメッセージ
         """
-        validation_results = {}
-        error_messages = {}
-        
-        # 必須キーの検証
-        for key_name, description in self.REQUIRED_KEYS.items():
-            exists = key_name in self._api_keys_cache
-            validation_results[key_name] = exists
-            
-            if not exists:
-                error_messages[key_name] = f"必須APIキー '{key_name}' ({description}) が設定されていません"
-        
-        # オプションキーの検証
-        for key_name, description in self.OPTIONAL_KEYS.items():
-            exists = key_name in self._api_keys_cache
-            validation_results[key_name] = exists
-            
-            if not exists:
-                error_messages[key_name] = f"オプションAPIキー '{key_name}' ({description}) が設定されていません"
+        cache = self._present_keys()
+        validation_results = {k: k in cache for k in self._ALL_KEYS}
+        
+        error_messages = {
+            key_name: f"必須APIキー '{key_name}' ({description}) が設定されていません"
+            for key_name, description in self.REQUIRED_KEYS.items()
+            if key_name not in cache
+        }
+        error_messages.update(
+            (key_name, f"オプションAPIキー '{key_name}' ({description}) が設定されていません")
+            for key_name, description in self.OPTIONAL_KEYS.items()
+            if key_name not in cache
+        )
         
         return validation_results, error_messages
     
@@ -101,14 +103,8 @@ class APIKeyManager:
                 - すべてのキーが存在するかどうか
                 - 不足しているキーのリスト
         """
-        required_keys = self.PROVIDER_API_KEYS.get(provider, [])
-        missing_keys = []
-        
-        for key_name in required_keys:
-            if key_name not in self._api_keys_cache:
-                missing_keys.append(key_name)
-        
-        return len(missing_keys) == 0, missing_keys
+        missing = self._PROVIDER_SETS.get(provider, frozenset()) - self._present_keys()
+        return not missing, sorted(missing)
     
     def get_provider_api_key(self, provider: LLMProviderType) -> Optional[str]:
         """プロバイダーに対応するAPIキーを取得
@@ -132,33 +128,45 @@ class APIKeyManager:
         
         return None
     
-    def print_validation_report(self) -> None:
-        """APIキーの検証レポートを表示"""
-        validation_results, error_messages = self.validate_all_keys()
+    def _report_lines(self) -> Iterator[str]:
+        """APIキー検証レポートの各行を生成"""
+        validation_results, _ = self.validate_all_keys()
         
-        print("\n=== APIキー検証レポート ===")
+        yield "\n=== APIキー検証レポート ==="
         
         # 必須キーの状況
-        print("\n🔑 必須APIキー:")
+        yield "\n🔑 必須APIキー:"
         for key_name, description in self.REQUIRED_KEYS.items():
             status = "✅ 設定済み" if validation_results[key_name] else "❌ 未設定"
-            print(f"  {key_name} ({description}): {status}")
+            yield f"  {key_name} ({description}): {status}"
         
         # オプションキーの状況
-        print("\n🔧 オプションAPIキー:")
+        yield "\n🔧 オプションAPIキー:"
         for key_name, description in self.OPTIONAL_KEYS.items():
             status = "✅ 設定済み" if validation_results[key_name] else "⚠️ 未設定"
-            print(f"  {key_name} ({description}): {status}")
+            yield f"  {key_name} ({description}): {status}"
         
         # エラーがある場合の対処法を表示
         missing_required = [k for k in self.REQUIRED_KEYS.keys() if not validation_results[k]]
         if missing_required:
-            print("\n🚨 対処が必要:")
-            print("  1. プロジェクトルートに .env ファイルを作成")
-            print("  2. .env.example を参考に以下のキーを設定:")
+            yield "\n🚨 対処が必要:"
+            yield "  1. プロジェクトルートに .env ファイルを作成"
+            yield "  2. .env.example を参考に以下のキーを設定:"
             for key_name in missing_required:
-                print(f"     {key_name}=your_api_key_here")
-            print("  3. アプリケーションを再起動")
+                yield f"     {key_name}=your_api_key_here"
+            yield "  3. アプリケーションを再起動"
+    
+    def print_validation_report(self) -> None:
+        """APIキーの検証レポートをINFOレベルでログ出力
+        
+        INFOレベルが無効な場合はレポートの組み立て自体を行いません。
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(self._report_lines()))
+    
+    def cli_report(self) -> None:
+        """APIキーの検証レポートを標準出力に表示（ユーザー向け）"""
+        print("\n".join(self._report_lines()))
     
     def has_required_keys(self) -> bool:
         """必須APIキーがすべて設定されているかチェック
@@ -166,14 +174,28 @@ class APIKeyManager:
         Returns:
             bool: 必須キーがすべて設定されている場合True
         """
-        for key_name in self.REQUIRED_KEYS.keys():
-            if key_name not in self._api_keys_cache:
-                return False
-        return True
+        return self._REQUIRED_SET <= self._present_keys()
+
+
+@cache
+def _get_manager() -> APIKeyManager:
+    """グローバルなAPIキーマネージャーインスタンスを遅延生成して取得
+    
+    初回呼び出し時に.envファイルを読み込んでからインスタンスを生成します。
+    
+    Returns:
+        APIKeyManager: 共有インスタンス
+    """
+    from .config_loader import load_env_file
+    load_env_file()
+    return APIKeyManager()
 
 
-# グローバルなAPIキーマネージャーインスタンス
-api_key_manager = APIKeyManager()
+def __getattr__(name: str) -> APIKeyManager:
+    # 後方互換性: api_key_manager は初回アクセス時に生成する
+    if name == "api_key_manager":
+        return _get_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_api_key(key_name: str) -> Optional[str]:
@@ -185,17 +207,29 @@ def get_api_key(key_name: str) -> Optional[str]:
     Returns:
         Optional[str]: APIキーの値
     """
-    return api_key_manager.get_api_key(key_name)
+    return _get_manager().get_api_key(key_name)
+
+
+def has_required_keys() -> bool:
+    """必須APIキーがすべて設定されているかを出力なしで確認する便利関数
+    
+    Returns:
+        bool: 必須キーがすべて設定されている場合True
+    """
+    return _get_manager().has_required_keys()
 
 
 def validate_api_keys() -> bool:
-    """APIキーを検証する便利関数
+    """APIキーを検証し、検証レポートをログ出力する便利関数
+    
+    ユーザー向けにレポートを表示する場合は APIKeyManager.cli_report() を使用してください。
     
     Returns:
         bool: 必須キーがすべて設定されている場合True
     """
-    api_key_manager.print_validation_report()
-    return api_key_manager.has_required_keys()
+    manager = _get_manager()
+    manager.print_validation_report()
+    return manager.has_required_keys()
 
 
 def get_provider_api_key(provider: LLMProviderType) -> Optional[str]:
@@ -207,4 +241,4 @@ def get_provider_api_key(provider: LLMProviderType) -> Optional[str]:
     Returns:
         Optional[str]: APIキーの値
     """
-    return api_key_manager.get_provider_api_key(provider)
\ No newline at end of file
+    return _get_manager().get_provider_api_key(provider)
@@ -5,15 +5,26 @@ TradingAgentsプロジェクトの型安全な設定ローダー
 .envファイルからの環境変数読み込みをサポートします。
 """
 
+import io
 import os
-from typing import Optional, Any
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Any
 from .config_types import TradingAgentsConfig, PartialConfig, LLMProviderType
+from .api_keys import has_required_keys
 
-try:
-    from dotenv import load_dotenv
-    _DOTENV_AVAILABLE = True
-except ImportError:
-    _DOTENV_AVAILABLE = False
+_VALID_PROVIDERS = ("openai", "anthropic", "google", "ollama", "openrouter")
+
+
+def _parse_bool(raw: str) -> bool:
+    return raw.lower() in ("true", "1", "yes", "on")
+
+
+def _parse_int(key: str, raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError as e:
+        raise ValueError(f"Environment variable {key}='{raw}' cannot be converted to int") from e
 
 
 def get_bool_env(key: str, default: bool) -> bool:
@@ -29,7 +40,7 @@ def get_bool_env(key: str, default: bool) -> bool:
     value = os.getenv(key)
     if value is None:
         return default
-    return value.lower() in ("true", "1", "yes", "on")
+    return _parse_bool(value)
 
 
 def get_int_env(key: str, default: int) -> int:
@@ -48,10 +59,7 @@ def get_int_env(key: str, default: int) -> int:
     value = os.getenv(key)
     if value is None:
         return default
-    try:
-        return int(value)
-    except ValueError as e:
-        raise ValueError(f"Environment variable {key}='{value}' cannot be converted to int") from e
+    return _parse_int(key, value)
 
 
 def get_str_env(key: str, default: str) -> str:
@@ -67,54 +75,111 @@ def get_str_env(key: str, default: str) -> str:
     return os.getenv(key, default)
 
 
-def load_env_file() -> None:
+# .envファイルの解析結果キャッシュ（キー: (ファイルパス, 更新時刻ns)）
+# ${VAR}の展開はos.environに依存するため、展開前の値を保持する
+_ENV_CACHE: dict[tuple[str, int], dict[str, Optional[str]]] = {}
+
+
+# ${VAR} / ${VAR:-default} 参照（python-dotenvのPOSIX変数展開と同じ書式）
+_ENV_VAR_REF = re.compile(r"\$\{(?P<name>[^\}:]*)(?::-(?P<default>[^\}]*))?\}")
+
+
+def _resolve_env_values(raw_values: dict[str, Optional[str]]) -> dict[str, Optional[str]]:
+    """.envの値に含まれる${VAR}を展開する
+    
+    load_dotenv(override=False)と同じ解決順序で、既存の環境変数を優先し、
+    次に.env内で先に定義された値、最後に:-のデフォルト値（なければ空文字）を使います。
+    
+    Args:
+        raw_values: 展開前の.envの値（キー -> 値）
+        
+    Returns:
+        dict[str, Optional[str]]: 展開後の値
+    """
+    resolved: dict[str, Optional[str]] = {}
+    environ = os.environ
+    
+    def substitute(match: "re.Match[str]") -> str:
+        name = match["name"]
+        if name in environ:
+            return environ[name]
+        value = resolved.get(name, match["default"] or "")
+        return value if value is not None else ""
+    
+    for key, value in raw_values.items():
+        resolved[key] = None if value is None else _ENV_VAR_REF.sub(substitute, value)
+    return resolved
+
+
+def load_env_file(verbose: bool = False) -> None:
     """環境変数ファイル(.env)を読み込む
     
     python-dotenvが利用可能な場合、プロジェクトルートの.envファイルを読み込みます。
+    解析結果は(パス, 更新時刻)をキーにキャッシュされ、ファイルが変更されない限り
+    2回目以降の呼び出しでは再解析を行いません。
+    既に設定済みの環境変数は上書きせず、${VAR}も既存の環境変数を優先して
+    展開します（load_dotenv(override=False)と同じ挙動）。
+    
+    Args:
+        verbose: 読み込み状況を表示するかどうか (デフォルト: False)
     """
-    if _DOTENV_AVAILABLE:
-        # プロジェクトルートの.envファイルを探す
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        env_file = os.path.join(project_root, ".env")
-        
-        if os.path.exists(env_file):
-            load_dotenv(env_file)
-            print(f"環境変数ファイルを読み込みました: {env_file}")
-        else:
+    # プロジェクトルートの.envファイルを探す
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    env_file = os.path.join(project_root, ".env")
+    
+    try:
+        st = os.stat(env_file)
+    except OSError:
+        if verbose:
             print(f"環境変数ファイルが見つかりません: {env_file}")
             print("APIキーは環境変数から直接読み込まれます。")
-    else:
+        return
+    
+    key = (env_file, st.st_mtime_ns)
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
         print("警告: python-dotenvがインストールされていません。")
         print("pip install python-dotenvでインストールしてください。")
+        return
+    
+    raw_values = _ENV_CACHE.get(key)
+    if raw_values is None:
+        # 1回のread()で読み込み、その時点のfstatでキャッシュキーを確定させる
+        with open(env_file, encoding="utf-8") as f:
+            key = (env_file, os.fstat(f.fileno()).st_mtime_ns)
+            text = f.read()
+        raw_values = dict(dotenv_values(stream=io.StringIO(text), interpolate=False))
+        _ENV_CACHE.clear()
+        _ENV_CACHE[key] = raw_values
+    
+    # load_dotenv(override=False)と同じく、${VAR}は既存の環境変数を優先して展開する
+    values = _resolve_env_values(raw_values)
+    environ = os.environ
+    os.environ.update(
+        {k: v for k, v in values.items() if v is not None and k not in environ}
+    )
+    if verbose:
+        print(f"環境変数ファイルを読み込みました: {env_file}")
 
 
-def validate_api_keys() -> dict[str, bool]:
-    """APIキーの存在を確認する
-    
-    Returns:
-        dict[str, bool]: 各APIキーの存在状況
-    """
-    api_keys = {
-        "OPENAI_API_KEY": bool(os.getenv("OPENAI_API_KEY")),
-        "FINNHUB_API_KEY": bool(os.getenv("FINNHUB_API_KEY")),
-        "ANTHROPIC_API_KEY": bool(os.getenv("ANTHROPIC_API_KEY")),
-        "GOOGLE_API_KEY": bool(os.getenv("GOOGLE_API_KEY")),
-    }
-    
-    # 必須APIキーのチェック
-    missing_required = []
-    if not api_keys["OPENAI_API_KEY"]:
-        missing_required.append("OPENAI_API_KEY")
-    if not api_keys["FINNHUB_API_KEY"]:
-        missing_required.append("FINNHUB_API_KEY")
-    
-    if missing_required:
-        print(f"警告: 必須APIキーが設定されていません: {', '.join(missing_required)}")
-        print("プロジェクトルートに.envファイルを作成して設定してください。")
-        print(".env.exampleファイルを参考にしてください。")
-    
-    return api_keys
+# 環境変数テーブル: (環境変数名, 設定キー, 型)
+_ENV_TABLE: tuple[tuple[str, str, type], ...] = (
+    # パス設定
+    ("TRADINGAGENTS_RESULTS_DIR", "results_dir", str),
+    ("TRADINGAGENTS_DATA_DIR", "data_dir", str),
+    # LLM設定
+    ("TRADINGAGENTS_LLM_PROVIDER", "llm_provider", str),
+    ("TRADINGAGENTS_DEEP_THINK_LLM", "deep_think_llm", str),
+    ("TRADINGAGENTS_QUICK_THINK_LLM", "quick_think_llm", str),
+    ("TRADINGAGENTS_BACKEND_URL", "backend_url", str),
+    # 動作設定
+    ("TRADINGAGENTS_MAX_DEBATE_ROUNDS", "max_debate_rounds", int),
+    ("TRADINGAGENTS_MAX_RISK_DISCUSS_ROUNDS", "max_risk_discuss_rounds", int),
+    ("TRADINGAGENTS_MAX_RECUR_LIMIT", "max_recur_limit", int),
+    ("TRADINGAGENTS_ONLINE_TOOLS", "online_tools", bool),
+)
 
 
 def get_config_from_env() -> PartialConfig:
@@ -126,51 +191,53 @@ def get_config_from_env() -> PartialConfig:
     # .envファイルを読み込み
     load_env_file()
     
-    # APIキーの確認
-    validate_api_keys()
-    
     config: PartialConfig = {}
-    
-    # パス設定
-    if os.getenv("TRADINGAGENTS_RESULTS_DIR"):
-        config["results_dir"] = get_str_env("TRADINGAGENTS_RESULTS_DIR", "./results")
-    
-    if os.getenv("TRADINGAGENTS_DATA_DIR"):
-        config["data_dir"] = get_str_env("TRADINGAGENTS_DATA_DIR", "/data")
-    
-    # LLM設定
-    if os.getenv("TRADINGAGENTS_LLM_PROVIDER"):
-        provider = get_str_env("TRADINGAGENTS_LLM_PROVIDER", "openai")
-        if provider in ("openai", "anthropic", "google", "ollama", "openrouter"):
-            config["llm_provider"] = provider  # type: ignore
+    env = os.environ
+    for env_key, config_key, typ in _ENV_TABLE:
+        raw = env.get(env_key)
+        if not raw:
+            continue
+        value: Any
+        if typ is bool:
+            value = _parse_bool(raw)
+        elif typ is int:
+            value = _parse_int(env_key, raw)
         else:
-            raise ValueError(f"Unsupported LLM provider from environment: {provider}")
+            value = raw
+        config[config_key] = value  # type: ignore[literal-required]
     
-    if os.getenv("TRADINGAGENTS_DEEP_THINK_LLM"):
-        config["deep_think_llm"] = get_str_env("TRADINGAGENTS_DEEP_THINK_LLM", "o4-mini")
-    
-    if os.getenv("TRADINGAGENTS_QUICK_THINK_LLM"):
-        config["quick_think_llm"] = get_str_env("TRADINGAGENTS_QUICK_THINK_LLM", "gpt-4o-mini")
-    
-    if os.getenv("TRADINGAGENTS_BACKEND_URL"):
-        config["backend_url"] = get_str_env("TRADINGAGENTS_BACKEND_URL", "https://api.openai.com/v1")
-    
-    # 動作設定
-    if os.getenv("TRADINGAGENTS_MAX_DEBATE_ROUNDS"):
-        config["max_debate_rounds"] = get_int_env("TRADINGAGENTS_MAX_DEBATE_ROUNDS", 1)
-    
-    if os.getenv("TRADINGAGENTS_MAX_RISK_DISCUSS_ROUNDS"):
-        config["max_risk_discuss_rounds"] = get_int_env("TRADINGAGENTS_MAX_RISK_DISCUSS_ROUNDS", 1)
-    
-    if os.getenv("TRADINGAGENTS_MAX_RECUR_LIMIT"):
-        config["max_recur_limit"] = get_int_env("TRADINGAGENTS_MAX_RECUR_LIMIT", 100)
-    
-    if os.getenv("TRADINGAGENTS_ONLINE_TOOLS"):
-        config["online_tools"] = get_bool_env("TRADINGAGENTS_ONLINE_TOOLS", True)
+    provider = config.get("llm_provider")
+    if provider is not None and provider not in _VALID_PROVIDERS:
+        raise ValueError(f"Unsupported LLM provider from environment: {provider}")
     
     return config
 
 
+_MISSING = object()
+
+# 設定検証テーブル: (フィールド名, 期待する型, 型名, 値の検証関数, 値エラー時のメッセージ)
+_SCHEMA: tuple[tuple[str, type, str, Optional[Callable[[Any], bool]], str], ...] = (
+    ("project_dir", str, "a string", None, ""),
+    ("results_dir", str, "a string", None, ""),
+    ("data_dir", str, "a string", None, ""),
+    ("data_cache_dir", str, "a string", None, ""),
+    ("llm_provider", object, "", _VALID_PROVIDERS.__contains__, "Unsupported LLM provider: {v}. Must be one of: " + str(_VALID_PROVIDERS)),
+    ("deep_think_llm", str, "a string", None, ""),
+    ("quick_think_llm", str, "a string", None, ""),
+    ("backend_url", str, "a string", None, ""),
+    ("max_debate_rounds", int, "an integer", lambda v: v >= 0, "max_debate_rounds must be non-negative"),
+    ("max_risk_discuss_rounds", int, "an integer", lambda v: v >= 0, "max_risk_discuss_rounds must be non-negative"),
+    ("max_recur_limit", int, "an integer", lambda v: v > 0, "max_recur_limit must be positive"),
+    ("online_tools", bool, "a boolean", None, ""),
+)
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    """パスの存在確認結果をキャッシュする（プロジェクトディレクトリは実行中に移動しない前提）"""
+    return os.path.exists(path)
+
+
 def validate_config(config: TradingAgentsConfig) -> TradingAgentsConfig:
     """設定の検証を行う
     
@@ -184,79 +251,47 @@ def validate_config(config: TradingAgentsConfig) -> TradingAgentsConfig:
         ValueError: 設定値が不正な場合
         TypeError: 設定の型が不正な場合
     """
-    # 必須フィールドの存在チェック
-    required_fields = [
-        "project_dir", "results_dir", "data_dir", "data_cache_dir",
-        "llm_provider", "deep_think_llm", "quick_think_llm", "backend_url",
-        "max_debate_rounds", "max_risk_discuss_rounds", "max_recur_limit", "online_tools"
-    ]
-    
-    for field in required_fields:
-        if field not in config:
-            raise ValueError(f"Required configuration field '{field}' is missing")
-    
-    # 型チェック
-    if not isinstance(config["project_dir"], str):
-        raise TypeError("project_dir must be a string")
-    
-    if not isinstance(config["results_dir"], str):
-        raise TypeError("results_dir must be a string")
-    
-    if not isinstance(config["data_dir"], str):
-        raise TypeError("data_dir must be a string")
-    
-    if not isinstance(config["data_cache_dir"], str):
-        raise TypeError("data_cache_dir must be a string")
-    
-    # LLMプロバイダーの検証
-    valid_providers = ("openai", "anthropic", "google", "ollama", "openrouter")
-    if config["llm_provider"] not in valid_providers:
-        raise ValueError(f"Unsupported LLM provider: {config['llm_provider']}. Must be one of: {valid_providers}")
-    
-    if not isinstance(config["deep_think_llm"], str):
-        raise TypeError("deep_think_llm must be a string")
-    
-    if not isinstance(config["quick_think_llm"], str):
-        raise TypeError("quick_think_llm must be a string")
-    
-    if not isinstance(config["backend_url"], str):
-        raise TypeError("backend_url must be a string")
-    
-    # 数値の検証
-    if not isinstance(config["max_debate_rounds"], int):
-        raise TypeError("max_debate_rounds must be an integer")
-    
-    if config["max_debate_rounds"] < 0:
-        raise ValueError("max_debate_rounds must be non-negative")
-    
-    if not isinstance(config["max_risk_discuss_rounds"], int):
-        raise TypeError("max_risk_discuss_rounds must be an integer")
-    
-    if config["max_risk_discuss_rounds"] < 0:
-        raise ValueError("max_risk_discuss_rounds must be non-negative")
-    
-    if not isinstance(config["max_recur_limit"], int):
-        raise TypeError("max_recur_limit must be an integer")
-    
-    if config["max_recur_limit"] <= 0:
-        raise ValueError("max_recur_limit must be positive")
-    
-    # ブール値の検証
-    if not isinstance(config["online_tools"], bool):
-        raise TypeError("online_tools must be a boolean")
+    get = config.get
+    for name, typ, type_name, pred, message in _SCHEMA:
+        v = get(name, _MISSING)
+        if v is _MISSING:
+            raise ValueError(f"Required configuration field '{name}' is missing")
+        if type(v) is not typ and not isinstance(v, typ):
+            raise TypeError(f"{name} must be {type_name}")
+        if pred is not None and not pred(v):
+            raise ValueError(message.format(v=v))
     
     # パスの存在チェック（プロジェクトディレクトリ）
-    if not os.path.exists(config["project_dir"]):
+    if not _path_exists(config["project_dir"]):
         raise ValueError(f"Project directory does not exist: {config['project_dir']}")
     
     return config
 
 
+# load_configの結果キャッシュ（キー: (オーバーライド項目, validate_keys)）
+_LOAD_CACHE: dict[tuple[Any, ...], TradingAgentsConfig] = {}
+
+# 必須APIキーの確認がこのプロセスで一度成功したかどうか
+_VALIDATED_ONCE = False
+
+
+def invalidate_config_cache() -> None:
+    """load_configのキャッシュを破棄し、次回呼び出しで設定を再構築させる
+    
+    実行中に環境変数や.envファイルを変更した場合に使用します。
+    """
+    global _VALIDATED_ONCE
+    _LOAD_CACHE.clear()
+    _VALIDATED_ONCE = False
+
+
 def load_config(override: Optional[PartialConfig] = None, validate_keys: bool = True) -> TradingAgentsConfig:
     """型安全な設定のロード
     
     デフォルト設定、環境変数、オーバーライドの順で設定を構築します。
     .env ファイルの読み込みとAPIキーの検証も実行します。
+    同じ引数での2回目以降の呼び出しはキャッシュ済みの設定のコピーを返します
+    （再読み込みは invalidate_config_cache() を使用）。
     
     Args:
         override: オーバーライドする設定項目
@@ -269,6 +304,20 @@ def load_config(override: Optional[PartialConfig] = None, validate_keys: bool =
         ValueError: 設定値が不正な場合、または必須APIキーが不足している場合
         TypeError: 設定の型が不正な場合
     """
+    global _VALIDATED_ONCE
+    
+    key: Optional[tuple[Any, ...]] = (
+        tuple(sorted(override.items())) if override else (),
+        validate_keys,
+    )
+    try:
+        cached = _LOAD_CACHE.get(key)  # type: ignore[arg-type]
+    except TypeError:
+        # ハッシュ不可能なオーバーライド値はキャッシュしない
+        key = cached = None
+    if cached is not None:
+        return cached.copy()
+    
     # デフォルト設定
     project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
     
@@ -298,10 +347,12 @@ def load_config(override: Optional[PartialConfig] = None, validate_keys: bool =
     # 設定の検証
     validated_config = validate_config(config)
     
-    # APIキーの検証（オプション）
-    if validate_keys:
-        from .api_keys import validate_api_keys
-        if not validate_api_keys():
+    # APIキーの検証（オプション、プロセス内で一度成功すれば以降は省略）
+    if validate_keys and not _VALIDATED_ONCE:
+        if not has_required_keys():
             raise ValueError("必須APIキーが設定されていません。.envファイルを確認してください。")
+        _VALIDATED_ONCE = True
     
+    if key is not None:
+        _LOAD_CACHE[key] = validated_config.copy()
     return validated_config
\ No newline at end of file
@@ -1,29 +1,71 @@
-from .finnhub_utils import get_data_in_range
-from .googlenews_utils import getNewsData
-from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
-from .stockstats_utils import StockstatsUtils
-from .yfin_utils import YFinanceUtils
-
-from .interface import (
-    # News and sentiment functions
-    get_finnhub_news,
-    get_finnhub_company_insider_sentiment,
-    get_finnhub_company_insider_transactions,
-    get_google_news,
-    get_reddit_global_news,
-    get_reddit_company_news,
-    # Financial statements functions
-    get_simfin_balance_sheet,
-    get_simfin_cashflow,
-    get_simfin_income_statements,
-    # Technical analysis functions
-    get_stock_stats_indicators_window,
-    get_stockstats_indicator,
-    # Market data functions
-    get_YFin_data_window,
-    get_YFin_data,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .finnhub_utils import get_data_in_range
+    from .googlenews_utils import getNewsData
+    from .yfin_utils import YFinanceUtils
+    from .reddit_utils import fetch_top_from_category
+    from .stockstats_utils import StockstatsUtils
+
+    from .interface import (
+        # News and sentiment functions
+        get_finnhub_news,
+        get_finnhub_company_insider_sentiment,
+        get_finnhub_company_insider_transactions,
+        get_google_news,
+        get_reddit_global_news,
+        get_reddit_company_news,
+        # Financial statements functions
+        get_simfin_balance_sheet,
+        get_simfin_cashflow,
+        get_simfin_income_statements,
+        # Technical analysis functions
+        get_stock_stats_indicators_window,
+        get_stockstats_indicator,
+        # Market data functions
+        get_YFin_data_window,
+        get_YFin_data,
+    )
+
+# Public name -> defining submodule. interface and stockstats_utils import
+# yfinance (and interface pulls in openai etc.) at module level, so they are
+# only loaded when one of their names is first used; importing a single
+# submodule such as yfin_utils no longer pays for all of them.
+_EXPORTS = {
+    "get_data_in_range": "finnhub_utils",
+    "getNewsData": "googlenews_utils",
+    "YFinanceUtils": "yfin_utils",
+    "fetch_top_from_category": "reddit_utils",
+    "StockstatsUtils": "stockstats_utils",
+    "get_finnhub_news": "interface",
+    "get_finnhub_company_insider_sentiment": "interface",
+    "get_finnhub_company_insider_transactions": "interface",
+    "get_google_news": "interface",
+    "get_reddit_global_news": "interface",
+    "get_reddit_company_news": "interface",
+    "get_simfin_balance_sheet": "interface",
+    "get_simfin_cashflow": "interface",
+    "get_simfin_income_statements": "interface",
+    "get_stock_stats_indicators_window": "interface",
+    "get_stockstats_indicator": "interface",
+    "get_YFin_data_window": "interface",
+    "get_YFin_data": "interface",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     # News and sentiment functions
@@ -6,44 +6,55 @@
 """
 
 import tradingagents.default_config as default_config
-from typing import Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 from tradingagents.config_types import TradingAgentsConfig, PartialConfig
 
-# Use default config but allow it to be overridden  
-_config: Optional[Dict] = None
-DATA_DIR: Optional[str] = None
+# Use default config but allow it to be overridden.
+# 読み取り専用ビューとして保持し、get_config()でのコピーを不要にする
+# 初期化はインポート時ではなく初回アクセス時に行う
+# DATA_DIRはグローバル変数として保持せず、__getattr__で_configから都度導出する
+_config: Optional[Mapping[str, Any]] = None
 
 
 def initialize_config():
     """Initialize the configuration with default values."""
-    global _config, DATA_DIR
+    global _config
     if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
-        DATA_DIR = _config["data_dir"]
+        _config = MappingProxyType(dict(default_config.DEFAULT_CONFIG))
 
 
 def set_config(config: Union[Dict, TradingAgentsConfig, PartialConfig]):
     """Update the configuration with custom values.
     
+    新しい読み取り専用ビューに差し替えるため、既存の参照は変更されません。
+    
     Args:
         config: 設定オブジェクト（Dictionary、TradingAgentsConfig、またはPartialConfig）
     """
-    global _config, DATA_DIR
-    if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
-    _config.update(config)  # type: ignore
-    DATA_DIR = _config["data_dir"]
+    global _config
+    base = default_config.DEFAULT_CONFIG if _config is None else _config
+    _config = MappingProxyType({**base, **config})
 
 
-def get_config() -> Dict:
+def get_config() -> Mapping[str, Any]:
     """Get the current configuration.
     
     Returns:
-        Dict: 現在の設定のコピー
+        Mapping[str, Any]: 現在の設定の読み取り専用ビュー
     """
     if _config is None:
         initialize_config()
-    return _config.copy()  # type: ignore
+    return _config  # type: ignore
+
+
+def get_config_dict() -> Dict[str, Any]:
+    """Get a mutable copy of the current configuration.
+    
+    Returns:
+        Dict[str, Any]: 現在の設定のコピー
+    """
+    return dict(get_config())
 
 
 def get_data_dir() -> str:
@@ -52,10 +63,11 @@ def get_data_dir() -> str:
     Returns:
         str: データディレクトリのパス
     """
-    if _config is None:
-        initialize_config()
-    return DATA_DIR or ""
+    return get_config().get("data_dir") or ""
 
 
-# Initialize with default config
-initialize_config()
+def __getattr__(name: str) -> Any:
+    # 後方互換: `from .config import DATA_DIR` は現在のdata_dirを返す
+    if name == "DATA_DIR":
+        return get_config()["data_dir"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,39 +1,298 @@
 # gets data/stats
 
-import yfinance as yf
-from typing import Annotated, Callable, Any, Optional, Dict, Union, Tuple
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Annotated, Any, Optional, Dict, Iterable, Union, Tuple
 from pandas import DataFrame
+import numpy as np
 import pandas as pd
-from functools import wraps
-from datetime import datetime
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
 
-from .utils import save_output, SavePathType, decorate_all_methods
-# Import type-safe date utilities
-from ..utils.date_utils import parse_date, format_date, add_days
+from .config import get_config
+from .utils import save_output, SavePathType
+from ..utils.date_utils import parse_date
 
 # Type aliases for better type safety
 # Note: Using Any for yfinance.Ticker due to missing library stubs
 DataFrameType = pd.DataFrame
 StockInfoType = Dict[str, Any]
 
+logger = logging.getLogger(__name__)
 
-def init_ticker(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator to initialize yf.Ticker and pass it to the function."""
 
-    @wraps(func)
-    def wrapper(self: 'YFinanceUtils', symbol: Annotated[str, "ticker symbol"], *args: Any, **kwargs: Any) -> Any:
-        ticker: Any = yf.Ticker(symbol)  # Using Any due to missing yfinance stubs
-        return func(self, ticker, *args, **kwargs)
+def _history_cache_path(symbol: str, start_date: str, end_date: str) -> str:
+    """Return the on-disk cache file for a (symbol, start, end) history request."""
+    key = hashlib.blake2b(
+        f"{symbol}|{start_date}|{end_date}".encode(), digest_size=16
+    ).hexdigest()
+    return os.path.join(get_config()["data_cache_dir"], "yf_cache", f"{key}.pkl")
 
-    return wrapper
+
+# Background writer for optional save_path CSV exports; worker threads are
+# joined at interpreter exit, so pending writes still complete.
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yf-csv")
+_pending_saves: "set[Future[None]]" = set()
+# First failed write not yet re-raised to a caller (later ones are only logged)
+_unreported_save_error: Optional[BaseException] = None
+_pending_lock = threading.Lock()
+
+
+def _write_csv(data: DataFrameType, path: str, label: str) -> None:
+    global _unreported_save_error
+    try:
+        data.to_csv(path)
+    except Exception as e:
+        # Recorded before the Future completes, so wait_for_pending_saves sees it
+        logger.error("Failed to save %s to %s: %s", label, path, e)
+        with _pending_lock:
+            if _unreported_save_error is None:
+                _unreported_save_error = e
+        raise
+    logger.info("%s saved to %s", label, path)
+
+
+def _raise_unreported_save_error() -> None:
+    global _unreported_save_error
+    with _pending_lock:
+        error, _unreported_save_error = _unreported_save_error, None
+    if error is not None:
+        raise error
+
+
+def _forget_save(future: "Future[None]") -> None:
+    with _pending_lock:
+        _pending_saves.discard(future)
+
+
+def _save_csv_async(data: DataFrameType, path: str, label: str) -> "Future[None]":
+    """Write ``data`` to ``path`` off the calling thread and return the Future.
+
+    A failure from an earlier background write (e.g. OSError for a bad path)
+    is re-raised here first, so it reaches the next caller instead of only
+    being logged.
+    """
+    _raise_unreported_save_error()
+    future = _io_pool.submit(_write_csv, data.copy(), path, label)
+    with _pending_lock:
+        _pending_saves.add(future)
+    future.add_done_callback(_forget_save)
+    return future
+
+
+def wait_for_pending_saves(timeout: Optional[float] = None) -> None:
+    """Block until queued save_path CSV exports finish.
+
+    Re-raises the first write error (e.g. OSError for a bad path) that has
+    not been reported yet, so callers that need the file can surface it.
+    """
+    with _pending_lock:
+        futures = list(_pending_saves)
+    wait(futures, timeout=timeout)
+    _raise_unreported_save_error()
+
+
+def _add_one_day(date_str: str) -> str:
+    """Return the YYYY-mm-dd string for the day after ``date_str``."""
+    try:
+        day = date.fromisoformat(date_str)
+    except ValueError:
+        # Non-padded input such as "2024-5-1" (rejected by fromisoformat on 3.10)
+        day = parse_date(date_str).date()
+    return (day + timedelta(days=1)).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _get_session() -> Any:
+    """Return one HTTP session shared by every ticker so connections are pooled.
+
+    yfinance (>=0.2.60) only accepts curl_cffi sessions; if curl_cffi is not
+    installed, None is returned and yfinance falls back to its own session.
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+    except ImportError:
+        return None
+    return curl_requests.Session(impersonate="chrome")
+
+
+def _new_ticker(symbol: str) -> Any:  # yf.Ticker, using Any due to missing stubs
+    """Construct a yf.Ticker on the shared session."""
+    # deferred: yfinance is slow to import; dataflows/__init__ loads its submodules
+    # lazily, so importing yfin_utils does not pay for it until a Ticker is built
+    import yfinance as yf
+
+    return yf.Ticker(symbol, session=_get_session())
+
+
+@lru_cache(maxsize=1024)
+def _get_ticker(symbol: str) -> Any:
+    """Return a shared yf.Ticker for the symbol instead of constructing one per call."""
+    return _new_ticker(symbol)
+
+
+# How long a settled history range is reused from memory/disk before it is
+# refetched (splits and dividends can still rewrite adjusted prices)
+_HISTORY_TTL_SECONDS = 24 * 60 * 60
+_HISTORY_MEMO_SIZE = 128
+_history_memo: "OrderedDict[Tuple[str, str, str], Tuple[float, DataFrameType]]" = OrderedDict()
+_history_lock = threading.Lock()
+
+
+def _history_is_settled(end_date: str) -> bool:
+    """Whether the last requested day (``end_date`` is exclusive) is a full day past.
+
+    Compared in UTC rather than local time, so a US session that is still
+    trading is never treated as final from a timezone that is already a day
+    ahead (e.g. JST).
+    """
+    return _add_one_day(end_date) <= datetime.now(timezone.utc).date().isoformat()
+
+
+def _remember_history(key: Tuple[str, str, str], fetched_at: float, data: DataFrameType) -> None:
+    with _history_lock:
+        _history_memo[key] = (fetched_at, data)
+        _history_memo.move_to_end(key)
+        if len(_history_memo) > _HISTORY_MEMO_SIZE:
+            _history_memo.popitem(last=False)
+
+
+def _read_history_file(path: str) -> Optional[DataFrameType]:
+    """Read a cached history pickle; a truncated or corrupt file is deleted and
+    treated as a miss instead of failing every call until the TTL expires."""
+    try:
+        data: DataFrameType = pd.read_pickle(path)
+    except Exception as e:
+        logger.warning("Discarding unreadable history cache %s: %s", path, e)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    return data
+
+
+def _write_history_file(path: str, data: DataFrameType) -> None:
+    """Pickle ``data`` to a temp file in the cache dir and atomically move it
+    into place, so readers and concurrent writers never see a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            data.to_pickle(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_history(symbol: str, start_date: str, end_date: str) -> DataFrameType:
+    """Fetch price history, reusing in-process and on-disk caches.
+
+    Only settled, non-empty ranges are cached (for _HISTORY_TTL_SECONDS);
+    ranges that can still gain bars and failed/empty downloads are always
+    refetched.
+    """
+    settled = _history_is_settled(end_date)
+    key = (symbol, start_date, end_date)
+    path = _history_cache_path(symbol, start_date, end_date)
+    if settled:
+        with _history_lock:
+            hit = _history_memo.get(key)
+            if hit is not None and time.time() - hit[0] < _HISTORY_TTL_SECONDS:
+                _history_memo.move_to_end(key)
+                return hit[1]
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and time.time() - mtime < _HISTORY_TTL_SECONDS:
+            cached = _read_history_file(path)
+            if cached is not None:
+                _remember_history(key, mtime, cached)
+                return cached
+
+    stock_data: DataFrameType = _get_ticker(symbol).history(start=start_date, end=end_date)
+    if settled and not stock_data.empty:
+        _write_history_file(path, stock_data)
+        _remember_history(key, time.time(), stock_data)
+    return stock_data
+
+
+# How long fetched Ticker attributes (info, statements, ...) stay fresh
+_ATTRIBUTE_TTL_SECONDS = 15 * 60
+
+
+def _current_ttl_bucket() -> int:
+    return int(time.monotonic() // _ATTRIBUTE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=128)
+def _ticker_for_bucket(symbol: str, ttl_bucket: int) -> Any:
+    """One yf.Ticker per symbol and TTL window.
+
+    yf.Ticker memoizes its attributes on the instance, so a new window needs
+    a new Ticker (reusing the process-wide one would return the first fetch
+    forever); within a window every attribute is read from the same Ticker.
+    """
+    return _new_ticker(symbol)
+
+
+@lru_cache(maxsize=128)
+def _fetch_attribute(symbol: str, kind: str, ttl_bucket: int) -> Any:
+    """Fetch ``Ticker.<kind>``; ``ttl_bucket`` rolls over to expire entries."""
+    return getattr(_ticker_for_bucket(symbol, ttl_bucket), kind)
+
+
+def _cached_attribute(symbol: str, kind: str, ttl_bucket: Optional[int] = None) -> Any:
+    """Return ``Ticker.<kind>`` (info, dividends, financials, balance_sheet,
+    cashflow, recommendations), fetching at most once per TTL window;
+    each uncached access is an HTTP round-trip."""
+    if ttl_bucket is None:
+        ttl_bucket = _current_ttl_bucket()
+    return _fetch_attribute(symbol, kind, ttl_bucket)
+
+
+def _load_info(symbol: str) -> StockInfoType:
+    """Fetch ``Ticker.info`` through the shared attribute cache."""
+    info: StockInfoType = _cached_attribute(symbol, "info")
+    return info
+
+
+# Output column -> yfinance info key used by get_company_info
+_COMPANY_INFO_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("Company Name", "shortName"),
+    ("Industry", "industry"),
+    ("Sector", "sector"),
+    ("Country", "country"),
+    ("Website", "website"),
+)
+_COMPANY_INFO_COLUMNS = [column for column, _ in _COMPANY_INFO_FIELDS]
+
+# get_all_financials result key -> yfinance Ticker attribute
+_FINANCIAL_STATEMENTS: Tuple[Tuple[str, str], ...] = (
+    ("income", "financials"),
+    ("balance", "balance_sheet"),
+    ("cashflow", "cashflow"),
+)
 
 
-@decorate_all_methods(init_ticker)
 class YFinanceUtils:
+    __slots__ = ()  # stateless; tickers and caches live at module level
 
     def get_stock_data(
         self,
-        ticker: Any,  # yf.Ticker, using Any due to missing stubs
+        symbol: Annotated[str, "ticker symbol"],
         start_date: Annotated[
             str, "start date for retrieving stock price data, YYYY-mm-dd"
         ],
@@ -44,78 +303,120 @@ class YFinanceUtils:
     ) -> DataFrameType:
         """retrieve stock price data for designated ticker symbol"""
         # add one day to the end_date so that the data range is inclusive
-        end_date_dt: datetime = add_days(end_date, 1)
-        end_date_formatted: str = format_date(end_date_dt)
-        stock_data: DataFrameType = ticker.history(start=start_date, end=end_date_formatted)
-        # save_output(stock_data, f"Stock data for {ticker.ticker}", save_path)
+        end_date_formatted: str = _add_one_day(end_date)
+        stock_data: DataFrameType = _load_history(symbol, start_date, end_date_formatted).copy()
+        # save_output(stock_data, f"Stock data for {symbol}", save_path)
         return stock_data
 
     def get_stock_info(
         self,
-        ticker: Any,  # yf.Ticker, using Any due to missing stubs
+        symbol: Annotated[str, "ticker symbol"],
     ) -> StockInfoType:
         """Fetches and returns latest stock information."""
-        stock_info: StockInfoType = ticker.info
+        stock_info: StockInfoType = dict(_load_info(symbol))
         return stock_info
 
     def get_company_info(
         self,
-        ticker: Any,  # yf.Ticker, using Any due to missing stubs
+        symbol: Annotated[str, "ticker symbol"],
         save_path: Optional[str] = None,
     ) -> DataFrameType:
-        """Fetches and returns company information as a DataFrame."""
-        info: StockInfoType = ticker.info
-        company_info: Dict[str, str] = {
-            "Company Name": info.get("shortName", "N/A"),
-            "Industry": info.get("industry", "N/A"),
-            "Sector": info.get("sector", "N/A"),
-            "Country": info.get("country", "N/A"),
-            "Website": info.get("website", "N/A"),
+        """Fetches and returns company information as a DataFrame.
+
+        If ``save_path`` is given the CSV is written in the background; call
+        ``wait_for_pending_saves()`` to block on it and surface write errors.
+        """
+        get = _load_info(symbol).get
+        company_info: Dict[str, list] = {
+            column: [get(key, "N/A")] for column, key in _COMPANY_INFO_FIELDS
         }
-        company_info_df: DataFrameType = DataFrame([company_info])
+        company_info_df: DataFrameType = DataFrame(
+            company_info, columns=_COMPANY_INFO_COLUMNS, copy=False
+        )
         if save_path:
-            company_info_df.to_csv(save_path)
-            print(f"Company info for {ticker.ticker} saved to {save_path}")
+            _save_csv_async(company_info_df, save_path, f"Company info for {symbol}")
         return company_info_df
 
     def get_stock_dividends(
         self,
-        ticker: Any,  # yf.Ticker, using Any due to missing stubs
+        symbol: Annotated[str, "ticker symbol"],
         save_path: Optional[str] = None,
     ) -> DataFrameType:
-        """Fetches and returns the latest dividends data as a DataFrame."""
-        dividends: DataFrameType = ticker.dividends
+        """Fetches and returns the latest dividends data as a DataFrame.
+
+        If ``save_path`` is given the CSV is written in the background; call
+        ``wait_for_pending_saves()`` to block on it and surface write errors.
+        """
+        dividends: DataFrameType = _cached_attribute(symbol, "dividends").copy()
         if save_path:
-            dividends.to_csv(save_path)
-            print(f"Dividends for {ticker.ticker} saved to {save_path}")
+            _save_csv_async(dividends, save_path, f"Dividends for {symbol}")
         return dividends
 
-    def get_income_stmt(self, ticker: Any) -> DataFrameType:  # yf.Ticker, using Any due to missing stubs
+    def get_income_stmt(self, symbol: Annotated[str, "ticker symbol"]) -> DataFrameType:
         """Fetches and returns the latest income statement of the company as a DataFrame."""
-        income_stmt: DataFrameType = ticker.financials
+        income_stmt: DataFrameType = _cached_attribute(symbol, "financials").copy()
         return income_stmt
 
-    def get_balance_sheet(self, ticker: Any) -> DataFrameType:  # yf.Ticker, using Any due to missing stubs
+    def get_balance_sheet(self, symbol: Annotated[str, "ticker symbol"]) -> DataFrameType:
         """Fetches and returns the latest balance sheet of the company as a DataFrame."""
-        balance_sheet: DataFrameType = ticker.balance_sheet
+        balance_sheet: DataFrameType = _cached_attribute(symbol, "balance_sheet").copy()
         return balance_sheet
 
-    def get_cash_flow(self, ticker: Any) -> DataFrameType:  # yf.Ticker, using Any due to missing stubs
+    def get_cash_flow(self, symbol: Annotated[str, "ticker symbol"]) -> DataFrameType:
         """Fetches and returns the latest cash flow statement of the company as a DataFrame."""
-        cash_flow: DataFrameType = ticker.cashflow
+        cash_flow: DataFrameType = _cached_attribute(symbol, "cashflow").copy()
         return cash_flow
 
-    def get_analyst_recommendations(self, ticker: Any) -> Tuple[Optional[str], Union[int, float]]:  # yf.Ticker, using Any due to missing stubs
+    def get_all_financials(self, symbol: Annotated[str, "ticker symbol"]) -> Dict[str, DataFrameType]:
+        """Fetches the income statement, balance sheet and cash flow statement in one call.
+
+        Convenience wrapper over the individual getters: each statement is still
+        its own request (and shares their cache), but all three are read from the
+        same Ticker and TTL window, so they form one consistent snapshot.
+        """
+        ttl_bucket = _current_ttl_bucket()
+        return {
+            name: _cached_attribute(symbol, kind, ttl_bucket).copy()
+            for name, kind in _FINANCIAL_STATEMENTS
+        }
+
+    def get_all_financials_batch(
+        self,
+        symbols: Annotated[Iterable[str], "ticker symbols"],
+        max_workers: Annotated[int, "number of concurrent fetch threads"] = 8,
+    ) -> Dict[str, Dict[str, DataFrameType]]:
+        """Fetches get_all_financials for many tickers concurrently, keyed by symbol.
+
+        The network round-trips are I/O-bound, so they are overlapped on a thread
+        pool; all threads reuse the shared session and Ticker/attribute caches.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_symbols)),
+            thread_name_prefix="yf-financials",
+        ) as executor:
+            return dict(
+                zip(unique_symbols, executor.map(self.get_all_financials, unique_symbols))
+            )
+
+    def get_analyst_recommendations(self, symbol: Annotated[str, "ticker symbol"]) -> Tuple[Optional[str], Union[int, float]]:
         """Fetches the latest analyst recommendations and returns the most common recommendation and its count."""
-        recommendations: DataFrameType = ticker.recommendations
-        if recommendations.empty:
+        recommendations: DataFrameType = _cached_attribute(symbol, "recommendations")
+        values = recommendations.values  # raw block, fetched once
+        if values.shape[0] == 0 or values.shape[1] < 2:
             return None, 0  # No recommendations available
 
-        # Assuming 'period' column exists and needs to be excluded
-        row_0: pd.Series = recommendations.iloc[0, 1:]  # Exclude 'period' column if necessary
-
-        # Find the maximum voting result
-        max_votes: Union[int, float] = row_0.max()
-        majority_voting_result: list = row_0[row_0 == max_votes].index.tolist()
+        # Assuming 'period' column exists and needs to be excluded; slice the
+        # raw row instead of materializing a labelled Series
+        votes = values[0, 1:]
+        # The block is object dtype (string period column); compare as float
+        # so missing counts are NaN and skipped like Series.max() did
+        counts = votes.astype(float)
+        if np.isnan(counts).all():
+            return None, 0
 
-        return majority_voting_result[0], max_votes
+        # Find the maximum voting result (nanargmax returns the first of tied winners)
+        i = int(np.nanargmax(counts))
+        return recommendations.columns[1 + i], votes[i]
@@ -6,12 +6,13 @@ TradingAgentsプロジェクトのデフォルト設定
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any
 from .config_types import TradingAgentsConfig
 from .config_loader import load_config
 
-# 後方互換性のためのデフォルト設定（Dict[str, Any]型）
-DEFAULT_CONFIG: Dict[str, Any] = {
+# 後方互換性のためのデフォルト設定（読み取り専用。変更する場合は .copy() で複製する）
+DEFAULT_CONFIG: "MappingProxyType[str, Any]" = MappingProxyType({
     "project_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
     "results_dir": os.getenv("TRADINGAGENTS_RESULTS_DIR", "./results"),
     "data_dir": "/Users/yluo/Documents/Code/ScAI/FR1-data",
@@ -30,12 +31,14 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "max_recur_limit": 100,
     # Tool settings
     "online_tools": True,
-}
+})
 
 
 def get_default_config() -> TradingAgentsConfig:
     """型安全なデフォルト設定を取得
     
+    load_config() 側でメモ化されているため、2回目以降の呼び出しはキャッシュのコピーを返します。
+    
     Returns:
         TradingAgentsConfig: デフォルト設定
     """
@@ -51,7 +51,7 @@ class TradingAgentsGraph:
             config: Configuration object or dictionary. If None, uses default config
         """
         self.debug = debug
-        self.config = config or DEFAULT_CONFIG
+        self.config = config or DEFAULT_CONFIG.copy()
 
         # Update the interface's config
         set_config(self.config)
@@ -4,15 +4,22 @@ TradingAgentsプロジェクトのセットアップ支援ユーティリティ
 このモジュールは初回セットアップ時の支援機能を提供します。
 """
 
+import importlib.util
 import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.text import Text
+from typing import TYPE_CHECKING
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """richのConsoleを初回使用時に生成して取得（richのインポートを遅延させる）"""
+    from rich.console import Console
+    return Console()
 
 
 def check_environment() -> dict:
@@ -29,12 +36,8 @@ def check_environment() -> dict:
         "optional_api_keys": {}
     }
     
-    # python-dotenvのチェック
-    try:
-        import dotenv
-        results["python_dotenv"] = True
-    except ImportError:
-        results["python_dotenv"] = False
+    # python-dotenvのチェック（モジュール本体は実行せず存在のみ確認）
+    results["python_dotenv"] = importlib.util.find_spec("dotenv") is not None
     
     # ファイル存在チェック
     project_root = Path(__file__).parent.parent
@@ -59,6 +62,7 @@ def check_environment() -> dict:
 
 def display_environment_status(results: dict) -> None:
     """環境状況を表示"""
+    console = _get_console()
     console.print("\n[bold blue]🔍 環境チェック結果[/bold blue]")
     
     # 依存関係チェック
@@ -90,6 +94,9 @@ def setup_environment() -> bool:
     Returns:
         bool: セットアップが成功したかどうか
     """
+    from rich.prompt import Confirm
+    console = _get_console()
+    
     console.print("[bold green]🚀 TradingAgents環境セットアップ[/bold green]\n")
     
     # 環境チェック
@@ -145,6 +152,7 @@ def create_env_template() -> None:
     """環境変数テンプレートを作成（.env.exampleが存在しない場合）"""
     project_root = Path(__file__).parent.parent
     env_example = project_root / ".env.example"
+    console = _get_console()
     
     if env_example.exists():
         console.print("[yellow]⚠️ .env.exampleファイルは既に存在します[/yellow]")
@@ -196,6 +204,10 @@ def quick_setup() -> bool:
     Returns:
         bool: セットアップが完了したかどうか
     """
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    console = _get_console()
+    
     console.print(Panel(
         "[bold green]TradingAgents クイックセットアップ[/bold green]\n\n"
         "このセットアップでは以下を行います：\n"
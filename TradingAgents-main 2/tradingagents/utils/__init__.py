@@ -1,31 +1,71 @@
 """Utils package for TradingAgents."""
 
-from .date_utils import (
-    parse_date,
-    format_date,
-    date_range,
-    ensure_datetime,
-    ensure_string,
-    DateType,
-)
-
-from .message_utils import (
-    has_tool_calls,
-    has_content,
-    is_ai_message,
-    is_human_message,
-    is_system_message,
-    is_tool_message,
-    get_tool_calls_safely,
-    get_content_safely,
-    get_message_type,
-    has_tool_calls_and_not_empty,
-    safe_tool_calls_check,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .date_utils import (
+        parse_date,
+        format_date,
+        date_range,
+        ensure_datetime,
+        ensure_string,
+        DateType,
+    )
+
+    from .message_utils import (
+        has_tool_calls,
+        has_content,
+        is_ai_message,
+        is_human_message,
+        is_system_message,
+        is_tool_message,
+        get_tool_calls_safely,
+        get_content_safely,
+        get_message_type,
+        has_tool_calls_and_not_empty,
+        safe_tool_calls_check,
+    )
+
+# Public name -> defining submodule. date_utils pulls in pandas and
+# message_utils pulls in langchain_core, so each is imported on first use.
+_EXPORTS = {
+    "parse_date": "date_utils",
+    "format_date": "date_utils",
+    "date_range": "date_utils",
+    "ensure_datetime": "date_utils",
+    "ensure_string": "date_utils",
+    "DateType": "date_utils",
+    "has_tool_calls": "message_utils",
+    "has_content": "message_utils",
+    "is_ai_message": "message_utils",
+    "is_human_message": "message_utils",
+    "is_system_message": "message_utils",
+    "is_tool_message": "message_utils",
+    "get_tool_calls_safely": "message_utils",
+    "get_content_safely": "message_utils",
+    "get_message_type": "message_utils",
+    "has_tool_calls_and_not_empty": "message_utils",
+    "safe_tool_calls_check": "message_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "parse_date",
-    "format_date", 
+    "format_date",
     "date_range",
     "ensure_datetime",
     "ensure_string",
@@ -41,4 +81,4 @@ __all__ = [
     "get_message_type",
     "has_tool_calls_and_not_empty",
     "safe_tool_calls_check",
-]
\ No newline at end of file
+]
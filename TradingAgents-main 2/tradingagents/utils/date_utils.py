@@ -5,14 +5,44 @@ This module provides type-safe date conversion and manipulation functions
 to ensure consistent handling of datetime and string types throughout the system.
 """
 
-from datetime import datetime, timedelta
-from typing import Union, List, Optional, Iterator
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Union, List, Optional, Iterable, Iterator
 from dateutil.relativedelta import relativedelta
+import numpy as np
 import pandas as pd
 
 # Type alias for date inputs
 DateType = Union[str, datetime, pd.Timestamp]
 
+# Default format used by nearly every caller; formatted without strftime
+_ISO_FORMAT = "%Y-%m-%d"
+
+
+def _format_iso(date_obj: datetime) -> str:
+    """Format as YYYY-mm-dd without re-parsing the strftime format string."""
+    # strftime("%Y") does not zero-pad years below 1000 on glibc
+    if date_obj.year < 1000:
+        return date_obj.strftime(_ISO_FORMAT)
+    return f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}"
+
+
+def _is_canonical_iso(date_input: str) -> bool:
+    """True if ``date_input`` is exactly a valid YYYY-mm-dd date string."""
+    if len(date_input) != 10 or date_input[4] != "-" or date_input[7] != "-":
+        return False
+    try:
+        date.fromisoformat(date_input)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(date_input: str, format_str: str) -> datetime:
+    """Memoized strptime; datetime objects are immutable, so sharing is safe."""
+    return datetime.strptime(date_input, format_str)
+
 
 def parse_date(date_input: str, format_str: str = "%Y-%m-%d") -> datetime:
     """
@@ -32,9 +62,9 @@ def parse_date(date_input: str, format_str: str = "%Y-%m-%d") -> datetime:
         raise TypeError(f"Expected str, got {type(date_input)}")
     
     try:
-        return datetime.strptime(date_input, format_str)
+        return _parse_cached(date_input, format_str)
     except ValueError as e:
-        raise ValueError(f"Unable to parse date '{date_input}' with format '{format_str}': {e}")
+        raise ValueError(f"Unable to parse date '{date_input}' with format '{format_str}': {e}") from e
 
 
 def format_date(date_obj: datetime, format_str: str = "%Y-%m-%d") -> str:
@@ -54,6 +84,8 @@ def format_date(date_obj: datetime, format_str: str = "%Y-%m-%d") -> str:
     if not isinstance(date_obj, datetime):
         raise TypeError(f"Expected datetime, got {type(date_obj)}")
     
+    if format_str == _ISO_FORMAT:
+        return _format_iso(date_obj)
     return date_obj.strftime(format_str)
 
 
@@ -82,13 +114,19 @@ def ensure_datetime(date_input: DateType, format_str: str = "%Y-%m-%d") -> datet
         raise TypeError(f"Unsupported date type: {type(date_input)}")
 
 
-def ensure_string(date_input: DateType, format_str: str = "%Y-%m-%d") -> str:
+def ensure_string(
+    date_input: DateType,
+    format_str: str = "%Y-%m-%d",
+    validate: bool = True
+) -> str:
     """
     Convert various date types to string.
     
     Args:
         date_input: Date in string, datetime, or pandas Timestamp format
         format_str: Format string for output (default: "%Y-%m-%d")
+        validate: Whether to validate/normalize string input (default: True).
+            When False, strings are returned unchanged.
         
     Returns:
         str: Formatted date string
@@ -98,13 +136,18 @@ def ensure_string(date_input: DateType, format_str: str = "%Y-%m-%d") -> str:
         ValueError: If datetime conversion fails
     """
     if isinstance(date_input, str):
+        if not validate:
+            return date_input
+        if format_str == _ISO_FORMAT and _is_canonical_iso(date_input):
+            # Fast path: a canonical YYYY-mm-dd string round-trips to itself
+            return date_input
         # Validate the string by parsing and reformatting
-        parsed = parse_date(date_input, format_str)
-        return format_date(parsed, format_str)
+        return parse_date(date_input, format_str).strftime(format_str)
     elif isinstance(date_input, datetime):
-        return format_date(date_input, format_str)
-    elif isinstance(date_input, pd.Timestamp):
-        return format_date(date_input.to_pydatetime(), format_str)
+        # pandas Timestamp is a datetime subclass and formats directly
+        if format_str == _ISO_FORMAT:
+            return _format_iso(date_input)
+        return date_input.strftime(format_str)
     else:
         raise TypeError(f"Unsupported date type: {type(date_input)}")
 
@@ -136,14 +179,7 @@ def date_range(
     if start_dt > end_dt:
         raise ValueError(f"Start date {start_dt} is after end date {end_dt}")
     
-    dates = []
-    current_dt = start_dt
-    
-    while current_dt <= end_dt:
-        dates.append(format_date(current_dt, format_str))
-        current_dt += timedelta(days=step)
-    
-    return dates
+    return list(pd.date_range(start_dt, end_dt, freq=f"{step}D").strftime(format_str))
 
 
 def add_days(date_input: DateType, days: int, format_str: str = "%Y-%m-%d") -> datetime:
@@ -178,6 +214,39 @@ def subtract_days(date_input: DateType, days: int, format_str: str = "%Y-%m-%d")
     return date_obj - timedelta(days=days)
 
 
+def _business_day_offset(weekday: int, business_days: int) -> int:
+    """
+    Calendar-day offset equivalent to moving ``business_days`` weekdays.
+    
+    Closed-form O(1) replacement for walking one day at a time: a weekend
+    start is first snapped to the adjacent weekday (Friday when moving
+    forward, Monday when moving backward), then every 5 business days span
+    7 calendar days, plus 2 more if the remainder crosses a weekend.
+    
+    Args:
+        weekday: Start weekday (Monday=0, Sunday=6)
+        business_days: Number of business days to move (can be negative)
+        
+    Returns:
+        int: Number of calendar days to add
+    """
+    if business_days == 0:
+        return 0
+    
+    if business_days > 0:
+        # Snap Saturday/Sunday back to Friday
+        snap, start = (4 - weekday, 4) if weekday >= 5 else (0, weekday)
+        weeks, rem = divmod(business_days, 5)
+        weekend = 2 if start + rem >= 5 else 0
+        return snap + weeks * 7 + rem + weekend
+    
+    # Snap Saturday/Sunday forward to Monday
+    snap, start = (7 - weekday, 0) if weekday >= 5 else (0, weekday)
+    weeks, rem = divmod(-business_days, 5)
+    weekend = 2 if start - rem < 0 else 0
+    return snap - (weeks * 7 + rem + weekend)
+
+
 def add_business_days(
     date_input: DateType, 
     business_days: int, 
@@ -195,26 +264,7 @@ def add_business_days(
         datetime: New datetime object
     """
     date_obj = ensure_datetime(date_input, format_str)
-    
-    if business_days >= 0:
-        days_added = 0
-        current_date = date_obj
-        
-        while days_added < business_days:
-            current_date += timedelta(days=1)
-            # Monday=0, Sunday=6
-            if current_date.weekday() < 5:  # Monday to Friday
-                days_added += 1
-    else:
-        days_added = 0
-        current_date = date_obj
-        
-        while days_added > business_days:
-            current_date -= timedelta(days=1)
-            if current_date.weekday() < 5:  # Monday to Friday
-                days_added -= 1
-    
-    return current_date
+    return date_obj + timedelta(days=_business_day_offset(date_obj.weekday(), business_days))
 
 
 def get_trading_days_between(
@@ -236,16 +286,8 @@ def get_trading_days_between(
     start_dt = ensure_datetime(start_date, format_str)
     end_dt = ensure_datetime(end_date, format_str)
     
-    trading_days = []
-    current_date = start_dt
-    
-    while current_date <= end_dt:
-        # Monday=0, Sunday=6, so weekdays are 0-4
-        if current_date.weekday() < 5:
-            trading_days.append(format_date(current_date, format_str))
-        current_date += timedelta(days=1)
-    
-    return trading_days
+    # bdate_range skips Saturday/Sunday; normalize=False keeps any time component
+    return list(pd.bdate_range(start_dt, end_dt, normalize=False).strftime(format_str))
 
 
 def is_business_day(date_input: DateType, format_str: str = "%Y-%m-%d") -> bool:
@@ -259,10 +301,27 @@ def is_business_day(date_input: DateType, format_str: str = "%Y-%m-%d") -> bool:
     Returns:
         bool: True if business day, False otherwise
     """
+    if isinstance(date_input, datetime):
+        return date_input.weekday() < 5
     date_obj = ensure_datetime(date_input, format_str)
     return date_obj.weekday() < 5
 
 
+def is_business_day_array(dates: Iterable[DateType]) -> np.ndarray:
+    """
+    Vectorized is_business_day for many dates at once.
+    
+    Preferred over calling is_business_day in a loop for frame-sized inputs.
+    
+    Args:
+        dates: Array-like of date strings, datetimes, or pandas Timestamps
+        
+    Returns:
+        np.ndarray: Boolean array, True where the date is Monday-Friday
+    """
+    return np.asarray(pd.DatetimeIndex(pd.to_datetime(dates)).dayofweek < 5, dtype=bool)
+
+
 def calculate_date_difference(
     date1: DateType,
     date2: DateType,
@@ -296,5 +355,33 @@ def normalize_date_to_utc(date_input: DateType, format_str: str = "%Y-%m-%d") ->
     Returns:
         pd.Timestamp: Normalized timestamp with UTC timezone
     """
-    date_obj = ensure_datetime(date_input, format_str)
-    return pd.to_datetime(date_obj, utc=True).normalize()
\ No newline at end of file
+    if isinstance(date_input, datetime):
+        # Covers pd.Timestamp too; no round-trip through ensure_datetime
+        ts = pd.Timestamp(date_input)
+    elif (
+        isinstance(date_input, str)
+        and format_str == _ISO_FORMAT
+        and _is_canonical_iso(date_input)
+    ):
+        # pandas' C ISO-8601 parser instead of strptime; anything else goes
+        # through ensure_datetime so the declared format is still enforced
+        ts = pd.Timestamp(date_input)
+    else:
+        ts = pd.Timestamp(ensure_datetime(date_input, format_str))
+    
+    # Naive inputs are taken to be UTC, aware inputs are converted
+    ts = ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+    return ts.normalize()
+
+
+def normalize_dates_to_utc(dates: Iterable[DateType]) -> pd.DatetimeIndex:
+    """
+    Vectorized normalize_date_to_utc for many dates at once.
+    
+    Args:
+        dates: Array-like of date strings, datetimes, or pandas Timestamps
+        
+    Returns:
+        pd.DatetimeIndex: Midnight-normalized timestamps in UTC
+    """
+    return pd.DatetimeIndex(pd.to_datetime(dates, utc=True)).normalize()
\ No newline at end of file